@@ -6,14 +6,27 @@
 # Date  :
 # Desc  :
 
+import io
 import os
+import sys
 import json
 import time
 import logging
+import threading
 import base64
+import re
+import copy
+import hashlib
+import tempfile
+import functools
+import weakref
+import bisect
+from collections import OrderedDict
 from configparser import ConfigParser
-from typing import Any, Dict, Optional, Union, Callable, List, Tuple, Set
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, Union, Callable, List, Tuple, Set, FrozenSet
 from dataclasses import dataclass
+from types import MappingProxyType
 
 try:
     from cryptography.fernet import Fernet
@@ -28,78 +41,485 @@ try:
 except ImportError:
     yaml = None
 
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+    from watchdog.observers.api import ObservedWatch
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+
+try:
+    # 优先使用 libyaml 提供的 C 实现，比纯 Python 的 SafeLoader 快一个数量级
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+    _LIBYAML_AVAILABLE = True
+except ImportError:
+    _YamlLoader = yaml.SafeLoader if yaml else None
+    _YamlDumper = yaml.SafeDumper if yaml else None
+    _LIBYAML_AVAILABLE = False
+
+# 是否已提示过正在使用纯 Python 的 YAML 实现
+_libyaml_warned = False
+
+if _YamlLoader is not None:
+    logging.getLogger("ccconfig").debug(f"YAML 解析器: {_YamlLoader.__name__}")
+
+# JSON 解析优先使用 orjson / ujson，统一以 bytes 作为输入和输出。
+# 它们不支持 NaN/Infinity、超过 64 位的整数等标准库可以处理的内容，
+# 遇到这类数据时回退到标准库，保证能加载和保存的文件与标准库一致
+
+
+def _stdlib_json_dumps(obj: Any, indent: bool = False) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None).encode('utf-8')
+
+
+try:
+    import orjson
+
+    def _json_loads(data: Union[bytes, bytearray]) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return json.loads(data)
+
+    def _json_dumps(obj: Any, indent: bool = False) -> bytes:
+        # 与标准库保持一致，缩进输出时把非字符串键转换为字符串
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS if indent else 0)
+        except orjson.JSONEncodeError:
+            return _stdlib_json_dumps(obj, indent)
+except ImportError:
+    try:
+        import ujson
+
+        def _json_loads(data: Union[bytes, bytearray]) -> Any:
+            # ujson 只接受 str / bytes
+            try:
+                return ujson.loads(bytes(data) if isinstance(data, bytearray) else data)
+            except ValueError:
+                return json.loads(data)
+
+        def _json_dumps(obj: Any, indent: bool = False) -> bytes:
+            try:
+                # ujson 默认把 "/" 转义为 "\/"，与 json 模块的输出不一致
+                return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False,
+                                   indent=2 if indent else 0).encode('utf-8')
+            except (TypeError, ValueError, OverflowError):
+                return _stdlib_json_dumps(obj, indent)
+    except ImportError:
+        _json_loads = json.loads
+        _json_dumps = _stdlib_json_dumps
+
+try:
+    # 延迟加载模式下从大 JSON 文件中流式读取单个键
+    import ijson
+    from ijson.common import ObjectBuilder as _IjsonBuilder
+except ImportError:
+    ijson = None
+
+__all__ = ["Config", "ConfigItem"]
+
+_MISSING = object()
+# 键路径的某个上级在文件中不是字典，该文件会覆盖低优先级文件中的整个上级
+_SHADOWED = object()
+
+_INI_SECTION_RE = re.compile(r'^\[([^\]]+)\]$')
+
+# 小写字符串到布尔值的映射，不在其中的字符串按是否为空判断
+_BOOL_MAP = {
+    **dict.fromkeys(("true", "yes", "1", "on", "y", "t"), True),
+    **dict.fromkeys(("false", "no", "0", "off", "n", "f"), False),
+}
+_LIST_SPLIT = re.compile(r'\s*,\s*')
+
+
+@functools.lru_cache(maxsize=2048)
+def _split(key: str) -> Tuple[str, ...]:
+    """拆分点号分隔的配置键，结果按键缓存"""
+    return tuple(key.split('.'))
+
+
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+def _copy_tree(value: Any) -> Any:
+    """复制由字典和列表组成的配置数据
+
+    解析得到的叶子值都是不可变的标量，直接共享，只重建字典和列表，
+    比 copy.deepcopy 少了 memo 记录和逐个对象的分派开销；其他类型的值仍然深拷贝。
+    """
+    cls = type(value)
+    if cls is dict:
+        return {k: _copy_tree(v) for k, v in value.items()}
+    if cls is list:
+        return [_copy_tree(v) for v in value]
+    if cls in _SCALAR_TYPES:
+        return value
+    return copy.deepcopy(value)
+
+
+# 超过该大小的文件直接读入预分配的缓冲区
+_LARGE_FILE_SIZE = 64 * 1024
+
+# 文件变更事件的合并窗口（秒），编辑器保存时常见的连续写入/重命名只触发一次重载
+_RELOAD_DEBOUNCE = 0.1
+
+# 解析缓存最多保留的文件数，超出后淘汰最久未使用的文件
+_PARSE_CACHE_SIZE = 16
+
+# 生成的验证代码最多缓存的 schema 结构数，超出后淘汰最久未使用的
+_SCHEMA_CACHE_SIZE = 32
+
+# peek() 读取 YAML 文件开头的字节数
+_PEEK_SIZE = 4096
+# 顶层键所在行的起始位置：行首不是缩进、注释、序列项、文档标记、流式集合的结尾，
+# 也不是显式键（? key）或其值（: value），避免把一个键和它的值切开
+_YAML_TOP_LEVEL_LINE = re.compile(rb'\n(?=[^\s#\-.\]},:?])')
+# 显式键（? key）所在的行
+_YAML_EXPLICIT_KEY = re.compile(rb'^\?', re.M)
+# YAML 文档开始/结束标记
+_YAML_DOCUMENT_MARKER = re.compile(rb'^(?:---|\.\.\.)', re.M)
+
+
+def _read_bytes(filepath: str) -> Union[bytes, bytearray]:
+    """以二进制方式读取整个文件，大文件避免额外的内存拷贝"""
+    with open(filepath, 'rb', buffering=0) as f:
+        size = os.fstat(f.fileno()).st_size
+        if size <= _LARGE_FILE_SIZE:
+            return f.read()
+        buf = bytearray(size)
+        n = 0
+        with memoryview(buf) as view:
+            while n < size:
+                count = f.readinto(view[n:])
+                if not count:
+                    break
+                n += count
+        if n < size:
+            del buf[n:]
+        return buf
+
+
+# Python 3.10 起 dataclass 支持 slots，实例不再携带 __dict__
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class ConfigItem:
+    """配置项元数据，创建后不可修改"""
+    key: str
+    description: str = ""
+    default: Any = None
+    required: bool = False
+    type: Any = None
+    min_value: Optional[Union[int, float]] = None
+    max_value: Optional[Union[int, float]] = None
+    choices: Optional[FrozenSet[Any]] = None
+
+    def __post_init__(self) -> None:
+        # choices 统一转换为 frozenset；包含不可哈希的值时保留为元组
+        if self.choices is not None and not isinstance(self.choices, frozenset):
+            try:
+                choices = frozenset(self.choices)
+            except TypeError:
+                choices = tuple(self.choices)
+            object.__setattr__(self, "choices", choices)
+
+
+if WATCHDOG_AVAILABLE:
+    class _ReloadEventHandler(FileSystemEventHandler):
+        """将配置文件所在目录的修改、创建和移动事件转发给 Config"""
+
+        def __init__(self, config: "Config") -> None:
+            super().__init__()
+            # 弱引用，Observer 中残留的处理器不会阻止 Config 被回收
+            self._config = weakref.ref(config)
+
+        def _dispatch(self, path: str) -> None:
+            config = self._config()
+            if config is not None:
+                config._on_file_event(path)
+
+        def on_modified(self, event) -> None:
+            if not event.is_directory:
+                self._dispatch(event.src_path)
+
+        def on_created(self, event) -> None:
+            if not event.is_directory:
+                self._dispatch(event.src_path)
+
+        def on_moved(self, event) -> None:
+            # 编辑器通常先写临时文件再重命名覆盖原文件
+            if not event.is_directory:
+                self._dispatch(event.dest_path)
+
+
+# 所有 Config 实例共享一个 watchdog Observer，同一目录只注册一次监听并按引用计数释放，
+# 最后一个监听释放后停止 Observer 线程
+_observer_lock = threading.RLock()
+_shared_observer = None
+_watched_dir_refs: Dict[str, int] = {}
+_watched_dir_watches: Dict[str, Any] = {}
+
+
+def _acquire_watch(handler: Any, directory: str) -> None:
+    """为目录添加监听处理器，失败时抛出 OSError，且不留下注册状态"""
+    global _shared_observer
+    with _observer_lock:
+        observer = _shared_observer
+        if observer is None:
+            observer = Observer()
+            observer.start()
+            _shared_observer = observer
+        try:
+            watch = observer.schedule(handler, directory, recursive=False)
+        except OSError:
+            # 例如 inotify 实例数达到上限；撤销 schedule 已经添加的处理器
+            try:
+                observer.remove_handler_for_watch(handler, ObservedWatch(directory, recursive=False))
+            except (KeyError, ValueError):
+                pass
+            if not _watched_dir_refs:
+                _stop_shared_observer()
+            raise
+        _watched_dir_watches[directory] = watch
+        _watched_dir_refs[directory] = _watched_dir_refs.get(directory, 0) + 1
+
+
+def _release_watches(handler: Any, directories: Set[str]) -> None:
+    """移除处理器在这些目录上的监听，目录没有其他使用者时取消监听"""
+    with _observer_lock:
+        observer = _shared_observer
+        if observer is not None:
+            for directory in directories:
+                watch = _watched_dir_watches.get(directory)
+                if watch is None:
+                    continue
+                try:
+                    observer.remove_handler_for_watch(handler, watch)
+                except KeyError:
+                    pass
+                _watched_dir_refs[directory] -= 1
+                if not _watched_dir_refs[directory]:
+                    del _watched_dir_refs[directory]
+                    del _watched_dir_watches[directory]
+                    observer.unschedule(watch)
+            if not _watched_dir_refs:
+                _stop_shared_observer()
+        directories.clear()
+
+
+def _stop_shared_observer() -> None:
+    """停止共享的 Observer，调用方需持有 _observer_lock"""
+    global _shared_observer
+    observer = _shared_observer
+    _shared_observer = None
+    observer.stop()
+    # 可能在 Observer 线程内的回调中释放最后一个监听，此时不能等待自身结束
+    if observer is not threading.current_thread():
+        observer.join()
+
 
 class Config:
-    def __init__(self, auto_reload: bool = False, reload_interval: int = 5, 
+    def __init__(self, auto_reload: bool = False, reload_interval: int = 60, 
                  enable_logging: bool = False, log_level: int = logging.INFO,
-                 encryption_key: Optional[str] = None) -> None:
+                 encryption_key: Optional[str] = None,
+                 cache_dir: Optional[str] = None, lazy: bool = False,
+                 strict: bool = True) -> None:
         """Initialize a new Config instance.
         
         Args:
             auto_reload: 是否启用自动重载
-            reload_interval: 自动重载间隔时间(秒)
+            reload_interval: 未安装 watchdog 时轮询检查文件变更的间隔时间(秒)
             enable_logging: 是否启用日志记录
             log_level: 日志级别
             encryption_key: 用于加密敏感配置的密钥
+            cache_dir: YAML/INI 解析结果的 JSON 缓存目录，为 None 时不写磁盘缓存
+            lazy: 是否延迟解析配置文件。启用后 load() 只记录文件，get() 按需从各文件中读取单个键，
+                直到修改配置、校验、导出或重载等需要完整配置的操作时才解析并合并全部文件
+            strict: 是否检查配置项的取值范围和可选值，为 False 或设置了环境变量
+                CCCONFIG_NO_VALIDATE=1 时只做类型检查
         """
         self._config_data: Dict[str, Any] = {}
-        self._config_files: List[Tuple[str, int]] = []
+        # (文件路径, 优先级, 解析结果)，按优先级升序排列；解析结果与解析缓存共享，不能修改
+        self._config_files: List[Tuple[str, int, Dict[str, Any]]] = []
+        self._priorities: List[int] = []
+        self._merged_for: Optional[List[str]] = []
+        # 延迟加载模式下尚未解析的文件 (文件路径, 优先级)，以及按键缓存的读取结果
+        self._lazy = lazy
+        self._lazy_sources: List[Tuple[str, int]] = []
+        self._lazy_values: Dict[str, Any] = {}
+        # 以 schema 结构为键的生成代码，结构相同的 schema 共用同一个函数
+        self._schema_cache: "OrderedDict[Tuple, Callable]" = OrderedDict()
         self._config_metadata: Dict[str, ConfigItem] = {}
+        self._strict = strict and os.environ.get("CCCONFIG_NO_VALIDATE") != "1"
+        # 由已添加的配置项生成的验证规则，格式与 validate 的 schema 相同
+        self._validate_plan: Dict[str, Dict[str, Any]] = {}
+        # freeze() 生成的读取方法名，再次 freeze() 时可以覆盖
+        self._frozen_getters: Set[str] = set()
         self._auto_reload = auto_reload
         self._reload_interval = reload_interval
-        self._last_reload_time = 0.0
+        self._last_reload_time_ns = 0
         self._type_converters: Dict[str, Callable] = {
             'int': int,
             'float': float,
             'bool': self._convert_bool,
             'str': str,
             'list': self._convert_list,
-            'dict': self._convert_dict
+            'dict': self._convert_dict,
+            'path': self._convert_path
         }
-        self._change_listeners: Dict[str, Callable] = {}
+        # 绑定方法以 WeakMethod 保存，不会因为注册了监听器而阻止其所属对象被回收
+        self._change_listeners: Dict[str, Union[Callable, weakref.WeakMethod]] = {}
+        self._listener_lock = threading.RLock()
+        # 每个键的回调以元组保存，注册时整体替换，通知时无需加锁
+        self._watchers: Dict[str, Tuple[Callable[[Any, Any], None], ...]] = {}
+        self._parse_cache: "OrderedDict[str, Tuple[int, int, Dict[str, Any]]]" = OrderedDict()
+        self._parse_cache_lock = threading.Lock()
+        self._cache_dir = cache_dir
+        self._ini_parser: Optional[ConfigParser] = None
+        self._ini_lock = threading.Lock()
+        # 使用 watchdog 时的事件处理器，None 表示没有通过 watchdog 监听
+        self._watch_handler = None
+        self._watch_finalizer: Optional[weakref.finalize] = None
+        self._watched_dirs: Set[str] = set()
+        self._watched_paths: Set[str] = set()
+        self._poll_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._reload_timer: Optional[threading.Timer] = None
+        self._reload_timer_lock = threading.Lock()
         
-        # 初始化日志记录器
+        # 初始化日志记录器，多个实例共享同一个 logger，处理器只添加一次
+        self._enable_logging = enable_logging
         self._logger = logging.getLogger("ccconfig")
         if enable_logging:
-            handler = logging.StreamHandler()
-            formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-            handler.setFormatter(formatter)
-            self._logger.addHandler(handler)
+            if not any(h.get_name() == "ccconfig" for h in self._logger.handlers):
+                handler = logging.StreamHandler()
+                handler.set_name("ccconfig")
+                formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+                handler.setFormatter(formatter)
+                self._logger.addHandler(handler)
+                # 已有自己的输出，避免再经由 root logger 重复打印
+                self._logger.propagate = False
             self._logger.setLevel(log_level)
-        else:
+        elif not self._logger.handlers:
             self._logger.addHandler(logging.NullHandler())
         
         if auto_reload:
             self._start_auto_reload()
 
     def _start_auto_reload(self) -> None:
-        """启动自动重载线程"""
-        import threading
+        """启动自动重载
+
+        安装了 watchdog 时使用操作系统的文件变更通知（inotify/FSEvents/ReadDirectoryChangesW），
+        否则退回到定时轮询文件修改时间。
+        """
+        if WATCHDOG_AVAILABLE:
+            self._watch_handler = _ReloadEventHandler(self)
+            # Config 被回收时自动释放监听，close() 会提前调用
+            self._watch_finalizer = weakref.finalize(
+                self, _release_watches, self._watch_handler, self._watched_dirs)
+            for filepath in self._source_paths():
+                self._watch_file(filepath)
+            if self._watch_handler is not None:
+                self._logger.info("已启动配置文件监听")
+            return
+        self._start_polling()
+
+    def _start_polling(self) -> None:
+        """启动定时轮询文件修改时间的重载线程"""
         def reload_worker():
-            while True:
+            while not self._stop_event.wait(self._reload_interval):
                 try:
-                    time.sleep(self._reload_interval)
                     if self._should_reload():
                         self._logger.info("检测到配置文件变更，正在重新加载")
                         self.reload()
                 except Exception as e:
                     self._logger.error(f"自动重载过程中发生错误: {e}")
-                    
-        thread = threading.Thread(target=reload_worker, daemon=True, name="ConfigReloader")
-        thread.start()
+
+        self._poll_thread = threading.Thread(target=reload_worker, daemon=True, name="ConfigReloader")
+        self._poll_thread.start()
         self._logger.info(f"已启动配置自动重载线程，间隔: {self._reload_interval}秒")
 
+    def _watch_file(self, filepath: str) -> None:
+        """将配置文件加入监听，每个目录只注册一次；无法监听时改为定时轮询"""
+        if self._watch_handler is None:
+            return
+        path = os.path.abspath(filepath)
+        directory = os.path.dirname(path)
+        if directory not in self._watched_dirs:
+            try:
+                _acquire_watch(self._watch_handler, directory)
+            except OSError as e:
+                self._logger.warning(f"无法监听配置目录 {directory}，改为定时轮询: {e}")
+                self._watch_finalizer()
+                self._watch_handler = None
+                self._start_polling()
+                return
+            self._watched_dirs.add(directory)
+        self._watched_paths.add(path)
+
+    def close(self) -> None:
+        """停止自动重载，释放文件监听和轮询线程，可以重复调用"""
+        self._stop_event.set()
+        with self._reload_timer_lock:
+            if self._reload_timer is not None:
+                self._reload_timer.cancel()
+                self._reload_timer = None
+        if self._watch_finalizer is not None:
+            self._watch_finalizer()
+        self._watch_handler = None
+        thread = self._poll_thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        self._poll_thread = None
+
+    def _on_file_event(self, path: str) -> None:
+        """处理文件系统事件，只在已加载的配置文件变更时重载"""
+        if os.path.abspath(path) not in self._watched_paths:
+            return
+        self._logger.debug(f"检测到配置文件变更: {path}")
+        # 窗口内的后续事件会重新计时，只在最后一次事件之后重载一次
+        with self._reload_timer_lock:
+            if self._reload_timer is not None:
+                self._reload_timer.cancel()
+            self._reload_timer = threading.Timer(_RELOAD_DEBOUNCE, self._debounced_reload)
+            self._reload_timer.daemon = True
+            self._reload_timer.start()
+
+    def _debounced_reload(self) -> None:
+        """合并窗口结束后执行重载"""
+        with self._reload_timer_lock:
+            self._reload_timer = None
+        self._logger.info("检测到配置文件变更，正在重新加载")
+        try:
+            self.reload()
+        except Exception as e:
+            self._logger.error(f"自动重载过程中发生错误: {e}")
+
     def _should_reload(self) -> bool:
-        """判断是否需要重载"""
+        """判断是否需要重载
+
+        按目录分组，每个目录只做一次 os.scandir，再从目录项中读取文件状态。
+        """
         try:
-            for filepath, _ in self._config_files:
-                if not os.path.exists(filepath):
-                    self._logger.warning(f"配置文件已不存在: {filepath}")
-                    continue
-                    
-                if os.path.getmtime(filepath) > self._last_reload_time:
-                    self._logger.debug(f"配置文件已更改: {filepath}")
-                    return True
+            by_dir: Dict[str, Dict[str, str]] = {}
+            for filepath in self._source_paths():
+                path = os.path.abspath(filepath)
+                by_dir.setdefault(os.path.dirname(path), {})[os.path.basename(path)] = filepath
+
+            for directory, names in by_dir.items():
+                with os.scandir(directory) as it:
+                    entries = {entry.name: entry for entry in it if entry.name in names}
+                for name, filepath in names.items():
+                    entry = entries.get(name)
+                    if entry is None:
+                        self._logger.warning(f"配置文件已不存在: {filepath}")
+                        continue
+
+                    if entry.stat().st_mtime_ns > self._last_reload_time_ns:
+                        self._logger.debug(f"配置文件已更改: {filepath}")
+                        return True
         except Exception as e:
             self._logger.error(f"检查配置文件变更时出错: {e}")
         return False
@@ -111,7 +531,10 @@ class Config:
             name: Unique identifier for the listener
             callback: Function that takes (old_config, new_config) as arguments
         """
-        self._change_listeners[name] = callback
+        if hasattr(callback, '__self__') and hasattr(callback, '__func__'):
+            callback = weakref.WeakMethod(callback)
+        with self._listener_lock:
+            self._change_listeners[name] = callback
 
     def remove_change_listener(self, name: str) -> None:
         """Remove a previously registered change listener.
@@ -119,7 +542,10 @@ class Config:
         Args:
             name: Unique identifier of the listener to remove
         """
-        self._change_listeners.pop(name, None)
+        with self._listener_lock:
+            self._change_listeners.pop(name, None)
+            if name.startswith("watch_"):
+                self._watchers.pop(name[len("watch_"):], None)
 
     def _notify_change_listeners(self, old_config: Dict[str, Any], new_config: Dict[str, Any]) -> None:
         """Notify all registered listeners about configuration changes.
@@ -128,16 +554,33 @@ class Config:
             old_config: Configuration before changes
             new_config: Configuration after changes
         """
-        for listener in self._change_listeners.values():
+        # 在锁内取快照，回调在锁外执行，回调中可以安全地增删监听器
+        with self._listener_lock:
+            listeners = list(self._change_listeners.items())
+        log_error = self._logger.exception
+        for name, listener in listeners:
+            if isinstance(listener, weakref.WeakMethod):
+                listener = listener()
+                if listener is None:
+                    self._discard_dead_listener(name)
+                    continue
             try:
                 listener(old_config, new_config)
-            except Exception as e:
+            except Exception:
                 # Prevent one failing listener from breaking others
-                print(f"Error in config change listener: {e}")
+                log_error("Error in config change listener %r", name)
+
+    def _discard_dead_listener(self, name: str) -> None:
+        """移除所属对象已被回收的监听器"""
+        with self._listener_lock:
+            ref = self._change_listeners.get(name)
+            if isinstance(ref, weakref.WeakMethod) and ref() is None:
+                del self._change_listeners[name]
 
     def add_config_item(self, item: ConfigItem) -> None:
         """添加配置项元数据"""
         self._config_metadata[item.key] = item
+        self._validate_plan[item.key] = {"required": item.required, "default": item.default, "cast": item.type}
         if item.default is not None:
             self._set(item.key, item.default)
 
@@ -167,243 +610,405 @@ class Config:
             raise FileNotFoundError(f"Config file not found: {filepath}")
     
         self._logger.info(f"加载配置文件: {filepath} (优先级: {priority})")
-        self._config_files.append((filepath, priority))
-        self._config_files.sort(key=lambda x: x[1])
+        if self._lazy and not self._config_files:
+            # 还没有需要完整配置的操作，只记录文件，等到读取时再解析。
+            # 之前通过 add_config_item 等设置的值和普通模式一样，会在合并文件时被替换
+            self._lazy_sources.append((filepath, priority))
+            self._lazy_sources.sort(key=lambda source: source[1])
+            self._lazy_values.clear()
+            self._watch_file(filepath)
+            self._last_reload_time_ns = time.time_ns()
+            return
+
+        parsed = self._load_file(filepath)
+        # 在修改任何状态之前注册监听
+        self._watch_file(filepath)
+        index = bisect.bisect_right(self._priorities, priority)
+        # 当前数据恰好是已加载文件的合并结果，且新文件优先级最高时，只需把它合并进来
+        incremental = (
+            index == len(self._config_files)
+            and self._merged_for == [f for f, _, _ in self._config_files]
+        )
+        self._priorities.insert(index, priority)
+        self._config_files.insert(index, (filepath, priority, parsed))
     
-        new_data = {}
-        for f, _ in self._config_files:
-            loaded_data = self._load_file(f)
-            new_data = self._merge_dict(new_data, loaded_data)
-        
-        # Notify listeners of changes
-        old_data = self._config_data
-        self._config_data = new_data
-        self._notify_change_listeners(old_data, new_data)
-        self._last_reload_time = time.time()
+        if incremental:
+            new_data = self._config_data
+            old_data = _copy_tree(new_data) if self._change_listeners else new_data
+            self._merge_dict(new_data, _copy_tree(parsed))
+        else:
+            new_data = self._merge_files()
+            old_data = self._config_data
+        self._merged_for = [f for f, _, _ in self._config_files]
+        self._replace_data(old_data, new_data)
+
+    def load_many(self, sources: List[Tuple[str, int]], threads: int = 8) -> None:
+        """一次加载多个配置文件，所有文件解析完成后只合并一次
+
+        Args:
+            sources: (文件路径, 优先级) 列表
+            threads: 并发解析文件的最大线程数，为 1 时在当前线程中依次解析；
+                只有多个文件需要重新解析时才会启动线程池
+
+        Raises:
+            FileNotFoundError: 如果任一文件不存在，此时不会加载任何文件
+        """
+        for filepath, _ in sources:
+            if not os.path.isfile(filepath):
+                self._logger.error(f"配置文件未找到: {filepath}")
+                raise FileNotFoundError(f"Config file not found: {filepath}")
+
+        if self._lazy and not self._config_files:
+            for filepath, priority in sources:
+                self.load(filepath, priority)
+            return
+
+        files = [filepath for filepath, _ in sources]
+        self._logger.info(f"加载配置文件: {', '.join(files)}")
+        parsed = self._load_files(files, threads)
+        for filepath in files:
+            self._watch_file(filepath)
+
+        for (filepath, priority), data in zip(sources, parsed):
+            index = bisect.bisect_right(self._priorities, priority)
+            self._priorities.insert(index, priority)
+            self._config_files.insert(index, (filepath, priority, data))
+        self._merged_for = [f for f, _, _ in self._config_files]
+        self._replace_data(self._config_data, self._merge_files())
+
+    def _source_paths(self) -> List[str]:
+        """返回所有已加载（包括尚未解析）的配置文件路径"""
+        return [f for f, _, _ in self._config_files] + [f for f, _ in self._lazy_sources]
+
+    def _materialize(self) -> None:
+        """解析并合并延迟加载模式下记录的全部文件，之后按普通模式工作"""
+        if not self._lazy_sources:
+            return
+        sources = self._lazy_sources
+        self._lazy_sources = []
+        self._lazy_values.clear()
+        for filepath, priority in sources:
+            index = bisect.bisect_right(self._priorities, priority)
+            self._priorities.insert(index, priority)
+            self._config_files.insert(index, (filepath, priority, self._load_file(filepath)))
+        self._merged_for = [f for f, _, _ in self._config_files]
+        # 对使用者来说这些配置已经存在，不通知监听器
+        self._install_data(self._merge_files())
+
+    def _lazy_lookup(self, key: str) -> Any:
+        """在延迟加载模式下读取单个键，按优先级从高到低查找各文件"""
+        try:
+            return self._lazy_values[key]
+        except KeyError:
+            pass
+
+        parts = _split(key)
+        found = []
+        for filepath, _ in reversed(self._lazy_sources):
+            value = self._read_source_key(filepath, parts)
+            if value is _MISSING:
+                continue
+            if value is _SHADOWED:
+                # 上级被非字典值覆盖，更低优先级文件中的值在合并后都不可见
+                break
+            if not isinstance(value, dict):
+                # 非字典值会覆盖低优先级文件中的同名键，但自身会被更高优先级的字典覆盖
+                if not found:
+                    found.append(value)
+                break
+            found.append(value)
+
+        if not found:
+            value = _MISSING
+        elif not isinstance(found[0], dict):
+            value = found[0]
+        else:
+            value = {}
+            for data in reversed(found):
+                self._merge_dict(value, data)
+        self._lazy_values[key] = value
+        return value
+
+    def _read_source_key(self, filepath: str, parts: Tuple[str, ...]) -> Any:
+        """从单个配置文件中读取键路径对应的值
+
+        Returns:
+            值的副本；键不存在时返回 _MISSING，某个上级不是字典时返回 _SHADOWED
+        """
+        if (ijson is not None and filepath not in self._parse_cache
+                and os.path.splitext(filepath)[1].lower() == ".json"
+                and os.path.getsize(filepath) >= _LARGE_FILE_SIZE):
+            try:
+                return self._stream_json_key(filepath, parts)
+            except ijson.JSONError:
+                # ijson 不接受的内容（如 NaN）交给常规解析，与普通模式保持一致
+                pass
+
+        cur = self._load_file(filepath)
+        for part in parts:
+            if not isinstance(cur, dict):
+                return _SHADOWED
+            if part not in cur:
+                return _MISSING
+            cur = cur[part]
+        # 解析结果与解析缓存共享，返回副本
+        return _copy_tree(cur)
+
+    def _stream_json_key(self, filepath: str, parts: Tuple[str, ...]) -> Any:
+        """用 ijson 流式查找大 JSON 文件中的键，不构建整棵树，返回值与 _read_source_key 相同
+
+        按 map_key 事件逐级记录键路径，键名本身含点号时不会被误认为嵌套；
+        重复的键与 json.loads 一样以最后一次出现为准，因此总是扫描到文件末尾。
+        """
+        result = _MISSING
+        # 每层容器当前的键，数组用 None 占位；matched 为从根开始与 parts 一致的层数
+        keys: List[Optional[str]] = []
+        matched = 0
+        builder = None
+        building = 0
+        with open(filepath, 'rb') as f:
+            for event, value in ijson.basic_parse(f, use_float=True):
+                if builder is not None:
+                    builder.event(event, value)
+                    if event == 'start_map' or event == 'start_array':
+                        building += 1
+                    elif event == 'end_map' or event == 'end_array':
+                        building -= 1
+                        if not building:
+                            result = builder.value
+                            builder = None
+                    continue
+
+                if event == 'map_key':
+                    depth = len(keys)
+                    keys[-1] = value
+                    if matched >= depth - 1:
+                        matched = depth if depth <= len(parts) and value == parts[depth - 1] else depth - 1
+                    continue
+                if event == 'end_map' or event == 'end_array':
+                    keys.pop()
+                    if matched > len(keys):
+                        matched = len(keys)
+                    continue
+
+                # 一个值的开始：路径与 parts 一致或是其上级时，它会覆盖之前出现过的同名值
+                depth = len(keys)
+                if matched == depth and depth <= len(parts):
+                    if depth == len(parts):
+                        if event == 'start_map' or event == 'start_array':
+                            builder = _IjsonBuilder()
+                            builder.event(event, value)
+                            building = 1
+                            continue
+                        result = value
+                    elif event == 'start_map':
+                        result = _MISSING
+                    else:
+                        result = _SHADOWED
+                if event == 'start_map' or event == 'start_array':
+                    keys.append(None)
+        return result
+
+    def _merge_files(self) -> Dict[str, Any]:
+        """按优先级合并所有已加载文件的解析结果"""
+        new_data: Dict[str, Any] = {}
+        for _, _, data in self._config_files:
+            # 合并会修改目标中的字典，使用副本以保持解析结果不变
+            self._merge_dict(new_data, _copy_tree(data))
+        return new_data
+
+    def _install_data(self, new_data: Dict[str, Any]) -> None:
+        """把新的配置数据写入现有的配置字典
+
+        始终保留同一个字典对象，to_dict(readonly=True) 返回的视图在重新加载后依然有效。
+        先写入新值再删除多余的键，其他线程读取时不会看到空的配置。
+        """
+        data = self._config_data
+        if new_data is data:
+            return
+        data.update(new_data)
+        for key in [k for k in data if k not in new_data]:
+            del data[key]
+
+    def _replace_data(self, old_data: Dict[str, Any], new_data: Dict[str, Any]) -> None:
+        """替换当前配置数据并通知监听器"""
+        if old_data is self._config_data and new_data is not old_data:
+            # 配置字典会被原地更新，给监听器保留旧的顶层内容
+            old_data = dict(old_data)
+        self._install_data(new_data)
+        self._notify_change_listeners(old_data, self._config_data)
+        self._last_reload_time_ns = time.time_ns()
 
     def load_env(self, prefix: str = "") -> None:
-        """从环境变量加载配置"""
-        env_data = {}
-        for k, v in os.environ.items():
-            if k.startswith(prefix):
-                short_key = k[len(prefix):]
-                env_data[short_key] = v
-        self._config_data = self._merge_dict(self._config_data, env_data)
+        """从环境变量加载配置
+
+        去掉前缀后的变量名中的双下划线表示嵌套，例如 prefix="APP_" 时
+        APP_DB__HOST 会被加载为 {"DB": {"HOST": ...}}。分隔后的空段会被忽略；
+        同时存在 APP_DB 和 APP_DB__HOST 时以嵌套的值为准，并记录警告。
+        """
+        self._materialize()
+        if not prefix:
+            env_data = dict(os.environ)
+        else:
+            plen = len(prefix)
+            env_data = {k[plen:]: v for k, v in os.environ.items() if k.startswith(prefix)}
+        for key in [k for k in env_data if '__' in k]:
+            value = env_data.pop(key)
+            parts = [part for part in key.split('__') if part]
+            if not parts:
+                continue
+            *parents, leaf = parts
+            node = env_data
+            for part in parents:
+                child = node.get(part)
+                if not isinstance(child, dict):
+                    if child is not None:
+                        self._logger.warning(f"环境变量 {prefix}{key} 覆盖了 {part} 的值")
+                    child = node[part] = {}
+                node = child
+            if isinstance(node.get(leaf), dict):
+                self._logger.warning(f"环境变量 {prefix}{key} 与嵌套的同名配置冲突，已忽略")
+                continue
+            node[leaf] = value
+        self._merge_dict(self._config_data, env_data)
+        self._merged_for = None
 
     def get(self, key: str, default: Any = None, cast: Optional[Union[type, str, Callable]] = None) -> Any:
         """获取配置值，支持类型转换"""
-        keys = key.split('.')
-        cur = self._config_data
-        for k in keys:
-            if k not in cur:
-                return default
-            cur = cur[k]
-
-        if cast is not None:
+        if self._lazy_sources:
+            cur = self._lazy_lookup(key)
+            if cast is None:
+                return default if cur is _MISSING else cur
+        else:
+            # 每次都在当前的配置字典上查找，调用方修改了返回的子字典时也能读到最新的值
+            cur = self._config_data
             try:
-                if isinstance(cast, str):
-                    cast = self._type_converters.get(cast)
-                    if cast is None:
-                        raise ValueError(f"Unknown type converter: {cast}")
-                cur = self._cast_value(cur, cast)
-            except (ValueError, TypeError):
+                for part in _split(key):
+                    cur = cur[part]
+            except (KeyError, TypeError):
                 return default
-
-        return cur
+            if cast is None:
+                return cur
+        if cur is _MISSING:
+            return default
+        # 未知的转换器名称同样返回默认值
+        try:
+            # 最常用的内置类型直接调用，不经过 _cast_value 的分派
+            if cast is int or cast is str or cast is float:
+                return cast(cur)
+            return self._cast_value(cur, cast)
+        except (ValueError, TypeError):
+            return default
 
     def __getitem__(self, key: str) -> Any:
         return self.get(key)
 
-    def validate(self, schema: Dict[str, Dict[str, Any]]) -> None:
-        """验证配置项"""
-        for key, rules in schema.items():
-            required = rules.get("required", False)
-            default_val = rules.get("default", None)
-            cast_type = rules.get("cast", None)
+    def validate(self, schema: Optional[Dict[str, Dict[str, Any]]] = None) -> None:
+        """验证配置项
 
-            current_val = self.get(key, default=None, cast=None)
-            if current_val is None:
-                if required:
-                    raise ValueError(f"Missing required config key: {key}")
-                if default_val is not None:
-                    self._set(key, default_val)
-            else:
-                if cast_type is not None:
-                    try:
-                        converted_val = self._cast_value(current_val, cast_type)
-                        self._set(key, converted_val)
-                    except (ValueError, TypeError) as e:
-                        raise ValueError(
-                            f"Key '{key}' cannot be converted to {cast_type.__name__}: {e}"
-                        )
+        Args:
+            schema: 验证规则，为 None 时按 add_config_item 添加的配置项验证
+        """
+        self._materialize()
+        if schema is None:
+            schema = self._validate_plan
+        self.compile_schema(schema)(self)
 
-    def add_type_converter(self, name: str, converter: Callable) -> None:
-        """添加自定义类型转换器"""
-        self._type_converters[name] = converter
+    def compile_schema(self, schema: Dict[str, Dict[str, Any]]) -> Callable[["Config"], None]:
+        """将验证规则编译为专用的验证函数
 
-    def watch(self, key: str, callback: Callable[[Any, Any], None]) -> None:
-        """监听配置项变化"""
-        def listener(old_config: Dict[str, Any], new_config: Dict[str, Any]) -> None:
-            old_val = self._get_nested(old_config, key)
-            new_val = self._get_nested(new_config, key)
-            if old_val != new_val:
-                callback(old_val, new_val)
-        self.add_change_listener(f"watch_{key}", listener)
-
-    def _get_nested(self, config: Dict[str, Any], key: str) -> Any:
-        """获取嵌套配置值"""
-        keys = key.split('.')
-        cur = config
-        for k in keys:
-            if k not in cur:
-                return None
-            cur = cur[k]
-        return cur
+        生成的函数直接按键路径访问配置字典，省去逐项解释规则的开销。
+        生成的代码只取决于 schema 的结构（键、是否必需、是否有默认值和类型转换），
+        按结构缓存（只保留最近使用的若干个）；默认值和转换函数在每次调用时作为参数绑定，
+        因此只有默认值不同的 schema 不会重新生成代码。
 
-    def to_dict(self) -> Dict[str, Any]:
-        """返回当前配置的完整字典"""
-        return self._config_data
+        Args:
+            schema: 与 validate 相同格式的验证规则
 
-    def reload(self) -> None:
-        """重新加载所有配置文件"""
-        files = [f for f, _ in self._config_files]
-        self._config_files = []
-        for filepath in files:
-            self.load(filepath)
+        Returns:
+            接受 Config 实例作为参数的验证函数
 
-    def _load_file(self, filepath: str) -> Dict[str, Any]:
-        """根据文件扩展名加载配置文件"""
-        def save(self, filepath: str, format_type: str = None) -> None:
-            """将当前配置保存到文件
-            
-            Args:
-                filepath: 保存的文件路径
-                format_type: 文件格式，支持 'json', 'yaml', 'ini'，如果为 None 则根据文件扩展名自动判断
-            
-            Raises:
-                ValueError: 如果文件格式不支持
-                ImportError: 如果需要 PyYAML 但未安装
-            """
-            if format_type is None:
-                ext = os.path.splitext(filepath)[1].lower()
-                if ext in ('.json'):
-                    format_type = 'json'
-                elif ext in ('.yaml', '.yml'):
-                    format_type = 'yaml'
-                elif ext in ('.ini', '.cfg'):
-                    format_type = 'ini'
-                else:
-                    raise ValueError(f"无法从文件扩展名确定格式: {ext}")
-            
-            os.makedirs(os.path.dirname(os.path.abspath(filepath)), exist_ok=True)
-            
-            if format_type == 'json':
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    json.dump(self._config_data, f, ensure_ascii=False, indent=2)
-            elif format_type == 'yaml':
-                if yaml is None:
-                    raise ImportError("PyYAML 未安装，请安装它以支持 YAML 格式")
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    yaml.dump(self._config_data, f, allow_unicode=True)
-            elif format_type == 'ini':
-                parser = ConfigParser()
-                for section, values in self._config_data.items():
-                    if isinstance(values, dict):
-                        parser.add_section(section)
-                        for key, value in values.items():
-                            if isinstance(value, (str, int, float, bool)):
-                                parser.set(section, key, str(value))
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    parser.write(f)
+        Raises:
+            ValueError: 如果引用了未注册的类型转换器
+        """
+        structure = []
+        defaults: List[Any] = []
+        converters: List[Optional[Callable]] = []
+        messages: List[Optional[str]] = []
+        for key, rules in schema.items():
+            required = bool(rules.get("required", False))
+            default_val = rules.get("default", None)
+            cast_type = rules.get("cast", None)
+            if not required and default_val is None and cast_type is None:
+                # 没有任何规则的键不需要生成查找代码
+                continue
+
+            if required or default_val is None:
+                default_kind = None
+            elif type(default_val) in (dict, list):
+                default_kind = "copy"
             else:
-                raise ValueError(f"不支持的文件格式: {format_type}")
+                default_kind = "plain"
+            converter = message = None
+            if cast_type is not None:
+                if type(cast_type) is str:
+                    converter = self._type_converters.get(cast_type)
+                    if converter is None:
+                        raise ValueError(f"Unknown type converter: {cast_type}")
+                    type_name = cast_type
+                else:
+                    converter = self._convert_bool if cast_type is bool else cast_type
+                    type_name = getattr(cast_type, "__name__", repr(cast_type))
+                message = f"Key '{key}' cannot be converted to {type_name}: "
+            structure.append((key, required, default_kind, converter is not None))
+            defaults.append(default_val)
+            converters.append(converter)
+            messages.append(message)
 
-        ext = os.path.splitext(filepath)[1].lower()
-        if ext in (".ini", ".cfg"):
-            parser = ConfigParser()
-            parser.read(filepath, encoding="utf-8")
-            return self._configparser_to_dict(parser)
-        elif ext == ".json":
-            with open(filepath, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        elif ext in (".yaml", ".yml"):
-            if yaml is None:
-                raise ImportError("PyYAML is not installed. Please install it to parse YAML.")
-            with open(filepath, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f) or {}
+        cache_key = tuple(structure)
+        code = self._schema_cache.get(cache_key)
+        if code is not None:
+            self._schema_cache.move_to_end(cache_key)
         else:
-            raise ValueError(f"Unsupported file format: {ext}")
-
-    def _configparser_to_dict(self, parser: ConfigParser) -> Dict[str, Any]:
-        """将 ConfigParser 转换为字典"""
-        data = {}
-        for section in parser.sections():
-            data[section] = {}
-            for key, val in parser.items(section):
-                data[section][key] = val
-        return data
+            code = self._generate_validator(structure)
+            self._schema_cache[cache_key] = code
+            if len(self._schema_cache) > _SCHEMA_CACHE_SIZE:
+                self._schema_cache.popitem(last=False)
+        return functools.partial(code, _d=tuple(defaults), _c=tuple(converters), _m=tuple(messages))
 
-    def _merge_dict(self, base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
-        """递归合并字典"""
-        for k, v in override.items():
-            if (
-                k in base
-                and isinstance(base[k], dict)
-                and isinstance(v, dict)
-            ):
-                base[k] = self._merge_dict(base[k], v)
-            else:
-                base[k] = v
-        return base
-
-    def _set(self, key: str, value: Any) -> None:
-        """设置配置值"""
-        keys = key.split('.')
-        cur = self._config_data
-        for i, k in enumerate(keys):
-            if i == len(keys) - 1:
-                cur[k] = value
+    @staticmethod
+    def _generate_validator(structure: List[Tuple[str, bool, Optional[str], bool]]) -> Callable:
+        """按 schema 结构生成验证函数，默认值、转换函数和错误信息通过 _d/_c/_m 参数按序号传入"""
+        namespace: Dict[str, Any] = {"_MISSING": _MISSING, "_copy_tree": _copy_tree}
+        lines = ["def _validate(cfg, _d, _c, _m):", "    cfg._materialize()",
+                 "    d = cfg._config_data", "    _set = cfg._set"]
+        for i, (key, required, default_kind, has_cast) in enumerate(structure):
+            parts = _split(key)
+            lines.append(f"    v = d.get({parts[0]!r}, _MISSING)")
+            for part in parts[1:]:
+                lines.append(f"    v = v.get({part!r}, _MISSING) if isinstance(v, dict) else _MISSING")
+            lines.append("    if v is _MISSING or v is None:")
+            if required:
+                lines.append(f"        raise ValueError({'Missing required config key: ' + key!r})")
+            elif default_kind == "copy":
+                # 同一个默认值对象可能被多次写入配置，每次写入副本
+                lines.append(f"        _set({key!r}, _copy_tree(_d[{i}]))")
+            elif default_kind == "plain":
+                lines.append(f"        _set({key!r}, _d[{i}])")
             else:
-                if k not in cur:
-                    cur[k] = {}
-                cur = cur[k]
-
-    def _cast_value(self, val: Any, cast_type: Union[type, Callable]) -> Any:
-        """执行类型转换"""
-        if cast_type is bool:
-            return self._convert_bool(val)
-        return cast_type(val)
+                lines.append("        pass")
 
-    def _convert_bool(self, val: Any) -> bool:
-        """转换布尔值"""
-        if isinstance(val, bool):
-            return val
-        if isinstance(val, str):
-            lower_val = val.lower()
-            if lower_val in ["true", "yes", "1"]:
-                return True
-            elif lower_val in ["false", "no", "0"]:
-                return False
-        return bool(val)
-
-    def _convert_list(self, val: Union[str, list]) -> list:
-        """转换列表"""
-        if isinstance(val, list):
-            return val
-        if isinstance(val, str):
-            return [item.strip() for item in val.split(',')]
-        return list(val)
-
-    def _convert_dict(self, val: Union[str, dict]) -> dict:
-        """转换字典"""
-        if isinstance(val, dict):
-            return val
-        if isinstance(val, str):
-            try:
-                return json.loads(val)
-            except json.JSONDecodeError:
-                return {k.strip(): v.strip() for k, v in (item.split('=') for item in val.split(','))}
-        return dict(val)
+            if has_cast:
+                lines += [
+                    "    else:",
+                    "        try:",
+                    f"            v = _c[{i}](v)",
+                    "        except (ValueError, TypeError) as e:",
+                    f"            raise ValueError(_m[{i}] + str(e))",
+                    f"        _set({key!r}, v)",
+                ]
+        exec(compile("\n".join(lines), "<ccconfig schema>", "exec"), namespace)
+        return namespace["_validate"]
 
     def validate_item(self, key: str, value: Any) -> Tuple[bool, Optional[str]]:
         """验证单个配置项是否符合元数据定义的规则
@@ -432,6 +1037,9 @@ class Config:
             except (ValueError, TypeError):
                 return False, f"值 '{value}' 无法转换为类型 {metadata.type}"
         
+        if not self._strict:
+            return True, None
+
         # 选项检查
         if metadata.choices is not None and value not in metadata.choices:
             return False, f"值 '{value}' 不在允许的选项范围内: {metadata.choices}"
@@ -465,153 +1073,490 @@ class Config:
         
         return errors
 
+    def freeze(self) -> List[str]:
+        """在添加完全部配置项后生成专用的读取方法
+
+        为每个配置项生成 get_<键名>(default=None) 方法（键中的非标识符字符替换为下划线），
+        按固定的键路径直接取值，省去 get() 的键拆分和通用分派；同时预先编译 validate() 使用的验证函数。
+        可以多次调用，之前生成的方法会被重新生成；与其他已有属性重名的配置项不生成方法。
+
+        Returns:
+            List[str]: 生成的方法名
+        """
+        namespace: Dict[str, Any] = {"cfg": self}
+        lines = []
+        names = []
+        for key in self._config_metadata:
+            name = "get_" + re.sub(r'\W', '_', key)
+            if (hasattr(self, name) and name not in self._frozen_getters) or name in names:
+                self._logger.warning(f"方法名 {name} 已存在，跳过配置项: {key}")
+                continue
+            names.append(name)
+            lines += [
+                f"def {name}(default=None):",
+                "    if cfg._lazy_sources:",
+                f"        return cfg.get({key!r}, default)",
+                "    try:",
+                "        return cfg._config_data" + "".join(f"[{part!r}]" for part in _split(key)),
+                "    except (KeyError, TypeError):",
+                "        return default",
+            ]
+        exec(compile("\n".join(lines), "<ccconfig freeze>", "exec"), namespace)
+        for name in names:
+            setattr(self, name, namespace[name])
+        self._frozen_getters.update(names)
+
+        self.compile_schema(self._validate_plan)
+        return names
+
     def add_type_converter(self, name: str, converter: Callable) -> None:
         """添加自定义类型转换器"""
         self._type_converters[name] = converter
 
     def watch(self, key: str, callback: Callable[[Any, Any], None]) -> None:
-        """监听配置项变化"""
+        """监听配置项变化，同一个键可以注册多个回调
+
+        回调通过名为 watch_<key> 的变更监听器分发，移除该监听器会同时移除这个键的全部回调。
+        """
+        name = f"watch_{key}"
+        with self._listener_lock:
+            if name in self._change_listeners:
+                self._watchers[key] = self._watchers.get(key, ()) + (callback,)
+                return
+            # 分发监听器不存在（首次注册或已被移除）时重新开始
+            self._watchers[key] = (callback,)
+            self.add_change_listener(name, self._make_watch_listener(key))
+
+    def _make_watch_listener(self, key: str) -> Callable[[Dict[str, Any], Dict[str, Any]], None]:
+        """创建把某个键的变化分发给其全部回调的变更监听器"""
+        parts = _split(key)
+
+        # 注册时拆分好键路径，每次通知只做 dict.get
+        def fetch(config: Dict[str, Any]) -> Any:
+            cur = config
+            for part in parts:
+                if not isinstance(cur, dict):
+                    return None
+                cur = cur.get(part)
+            return cur
+
         def listener(old_config: Dict[str, Any], new_config: Dict[str, Any]) -> None:
-            old_val = self._get_nested(old_config, key)
-            new_val = self._get_nested(new_config, key)
+            old_val = fetch(old_config)
+            new_val = fetch(new_config)
             if old_val != new_val:
-                callback(old_val, new_val)
-        self.add_change_listener(f"watch_{key}", listener)
-
-    def _get_nested(self, config: Dict[str, Any], key: str) -> Any:
-        """获取嵌套配置值"""
-        keys = key.split('.')
-        cur = config
-        for k in keys:
-            if k not in cur:
-                return None
-            cur = cur[k]
-        return cur
+                for watcher in self._watchers.get(key, ()):
+                    try:
+                        watcher(old_val, new_val)
+                    except Exception:
+                        self._logger.exception("Error in config watcher for %r", key)
+        return listener
 
-    def to_dict(self) -> Dict[str, Any]:
-        """返回当前配置的完整字典"""
-        return self._config_data
+    def to_dict(self, readonly: bool = False) -> Union[Dict[str, Any], MappingProxyType]:
+        """返回当前配置的完整字典
 
-    def reload(self) -> None:
-        """重新加载所有配置文件"""
-        files = [f for f, _ in self._config_files]
-        self._config_files = []
-        for filepath in files:
-            self.load(filepath)
+        Args:
+            readonly: 为 True 时返回只读视图（MappingProxyType），不复制数据，
+                且会反映之后的配置变更（包括重新加载）；否则返回当前配置的副本，修改副本不会影响配置
+        """
+        self._materialize()
+        if readonly:
+            return MappingProxyType(self._config_data)
+        return _copy_tree(self._config_data)
 
-    def _load_file(self, filepath: str) -> Dict[str, Any]:
-        """根据文件扩展名加载配置文件"""
-        def save(self, filepath: str, format_type: str = None) -> None:
-            """将当前配置保存到文件
-            
-            Args:
-                filepath: 保存的文件路径
-                format_type: 文件格式，支持 'json', 'yaml', 'ini'，如果为 None 则根据文件扩展名自动判断
-            
-            Raises:
-                ValueError: 如果文件格式不支持
-                ImportError: 如果需要 PyYAML 但未安装
-            """
-            if format_type is None:
-                ext = os.path.splitext(filepath)[1].lower()
-                if ext in ('.json'):
-                    format_type = 'json'
-                elif ext in ('.yaml', '.yml'):
-                    format_type = 'yaml'
-                elif ext in ('.ini', '.cfg'):
-                    format_type = 'ini'
-                else:
-                    raise ValueError(f"无法从文件扩展名确定格式: {ext}")
-            
-            os.makedirs(os.path.dirname(os.path.abspath(filepath)), exist_ok=True)
-            
-            if format_type == 'json':
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    json.dump(self._config_data, f, ensure_ascii=False, indent=2)
-            elif format_type == 'yaml':
-                if yaml is None:
-                    raise ImportError("PyYAML 未安装，请安装它以支持 YAML 格式")
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    yaml.dump(self._config_data, f, allow_unicode=True)
-            elif format_type == 'ini':
-                parser = ConfigParser()
-                for section, values in self._config_data.items():
-                    if isinstance(values, dict):
-                        parser.add_section(section)
-                        for key, value in values.items():
-                            if isinstance(value, (str, int, float, bool)):
-                                parser.set(section, key, str(value))
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    parser.write(f)
+    def reload(self, threads: int = 8) -> None:
+        """重新加载所有配置文件
+
+        Args:
+            threads: 并发解析文件的最大线程数，为 1 时在当前线程中依次解析；
+                只有多个文件需要重新解析时才会启动线程池
+        """
+        self._materialize()
+        files = [f for f, _, _ in self._config_files]
+        parsed = self._load_files(files, threads)
+
+        if self._merged_for == files and all(data is old for (_, _, old), data in zip(self._config_files, parsed)):
+            # 所有文件都命中解析缓存且配置未被修改过，合并结果不会变化
+            self._logger.debug("配置文件均未变更，跳过重新合并")
+            self._last_reload_time_ns = time.time_ns()
+            return
+
+        self._config_files = [(f, p, data) for (f, p, _), data in zip(self._config_files, parsed)]
+        self._merged_for = files
+        self._replace_data(self._config_data, self._merge_files())
+
+    def peek(self, filepath: str, keys: Union[str, Tuple[str, ...], List[str]]) -> Dict[str, Any]:
+        """读取配置文件中的少数几个键，不加载到当前配置
+
+        较大的 YAML 文件仍会整个读入内存，但只用 YAML 解析开头约 4KB 中完整的顶层键，
+        其余部分只做文本扫描。所需的键不在开头部分、在后面再次出现、开头部分使用了
+        合并键（<<）、文件中有显式键（? key）或无法解析时再解析整个文件；其他格式直接
+        解析整个文件。只解析开头部分时不会检查文件其余部分的语法。
+
+        Args:
+            filepath: 配置文件路径
+            keys: 要读取的键，支持点号分隔的嵌套键
+
+        Returns:
+            Dict[str, Any]: 键到值的映射，文件中不存在的键不包含在结果中
+        """
+        if isinstance(keys, str):
+            keys = (keys,)
+        if not os.path.isfile(filepath):
+            raise FileNotFoundError(f"Config file not found: {filepath}")
+
+        if yaml is not None and os.path.splitext(filepath)[1].lower() in (".yaml", ".yml"):
+            head = self._peek_yaml(filepath, keys)
+            if head is not None:
+                result = self._pick_keys(head, keys)
+                if len(result) == len(keys):
+                    return result
+        return self._pick_keys(self._load_file(filepath), keys)
+
+    def _peek_yaml(self, filepath: str, keys: Union[Tuple[str, ...], List[str]]) -> Optional[Dict[str, Any]]:
+        """解析 YAML 文件开头完整的顶层键
+
+        读入整个文件后只解析开头部分。开头部分的结果可能与完整解析不一致（文件较小、
+        无法解析、使用了合并键或显式键、所需的顶层键在后面再次出现或包含多个文档）时返回 None。
+        """
+        content = _read_bytes(filepath)
+        if len(content) <= _PEEK_SIZE:
+            # 小文件直接完整解析，还能利用解析缓存
+            return None
+
+        # 截断到最后一个顶层键之前，保证保留下来的每个顶层键都是完整的
+        cut = 0
+        for match in _YAML_TOP_LEVEL_LINE.finditer(content, 0, _PEEK_SIZE):
+            cut = match.end()
+        if cut == 0:
+            return None
+        head = content[:cut]
+        rest = content[cut:]
+        # 合并键的值会被之后的显式键覆盖，多文档文件无法按单个文档加载
+        if b'<<' in head or _YAML_DOCUMENT_MARKER.search(rest):
+            return None
+        # 显式键可以是任意节点，无法用文本扫描判断它是否与所需的键重复
+        if _YAML_EXPLICIT_KEY.search(content):
+            return None
+        # 重复的顶层键以最后一次出现为准，后面出现了所需的顶层键时不能只看开头部分
+        names = []
+        for top in {_split(key)[0] for key in keys}:
+            name = re.escape(top.encode('utf-8'))
+            names += [name, b'"' + name + b'"', b"'" + name + b"'"]
+        if re.search(rb'^(?:' + b'|'.join(names) + rb')[ \t]*:', rest, re.M):
+            return None
+        try:
+            data = yaml.load(head, Loader=_YamlLoader)
+        except yaml.YAMLError:
+            return None
+        return data if isinstance(data, dict) else None
+
+    def _pick_keys(self, data: Dict[str, Any], keys: Union[Tuple[str, ...], List[str]]) -> Dict[str, Any]:
+        """从解析结果中取出指定键的值，返回副本以免修改解析缓存"""
+        result = {}
+        for key in keys:
+            cur = data
+            for part in _split(key):
+                if not isinstance(cur, dict) or part not in cur:
+                    break
+                cur = cur[part]
             else:
-                raise ValueError(f"不支持的文件格式: {format_type}")
+                result[key] = _copy_tree(cur)
+        return result
+
+    def invalidate_cache(self, filepath: Optional[str] = None) -> None:
+        """清除已解析文件的缓存，下次加载时强制重新解析
+
+        Args:
+            filepath: 只清除该文件的缓存，为 None 时清除全部
+        """
+        with self._parse_cache_lock:
+            if filepath is None:
+                self._parse_cache.clear()
+            else:
+                self._parse_cache.pop(filepath, None)
+        self._lazy_values.clear()
+
+    def save(self, filepath: str, format_type: str = None) -> None:
+        """将当前配置保存到文件
+        
+        Args:
+            filepath: 保存的文件路径
+            format_type: 文件格式，支持 'json', 'yaml', 'ini'，如果为 None 则根据文件扩展名自动判断
+        
+        Raises:
+            ValueError: 如果文件格式不支持
+            ImportError: 如果需要 PyYAML 但未安装
+        """
+        if format_type is None:
+            ext = os.path.splitext(filepath)[1].lower()
+            if ext == '.json':
+                format_type = 'json'
+            elif ext in ('.yaml', '.yml'):
+                format_type = 'yaml'
+            elif ext in ('.ini', '.cfg'):
+                format_type = 'ini'
+            else:
+                raise ValueError(f"无法从文件扩展名确定格式: {ext}")
+        
+        os.makedirs(os.path.dirname(os.path.abspath(filepath)), exist_ok=True)
+        self._materialize()
+        
+        if format_type == 'json':
+            with open(filepath, 'wb') as f:
+                f.write(_json_dumps(self._config_data, indent=True))
+        elif format_type == 'yaml':
+            if yaml is None:
+                raise ImportError("PyYAML 未安装，请安装它以支持 YAML 格式")
+            with open(filepath, 'w', encoding='utf-8') as f:
+                yaml.dump(self._config_data, f, Dumper=_YamlDumper, allow_unicode=True)
+        elif format_type == 'ini':
+            parser = ConfigParser()
+            for section, values in self._config_data.items():
+                if isinstance(values, dict):
+                    parser.add_section(section)
+                    for key, value in values.items():
+                        if isinstance(value, (str, int, float, bool)):
+                            parser.set(section, key, str(value))
+            with open(filepath, 'w', encoding='utf-8') as f:
+                parser.write(f)
+        else:
+            raise ValueError(f"不支持的文件格式: {format_type}")
+
+    def _load_files(self, files: List[str], threads: int) -> List[Dict[str, Any]]:
+        """加载多个配置文件，只把未命中解析缓存的文件交给线程池解析
+
+        Args:
+            files: 配置文件路径
+            threads: 并发解析的最大线程数，为 1 时在当前线程中依次解析
+        """
+        parsed = [self._lookup_parse_cache(f)[1] for f in files]
+        misses = [i for i, data in enumerate(parsed) if data is None]
+        if threads > 1 and len(misses) > 1:
+            with ThreadPoolExecutor(max_workers=min(threads, len(misses))) as executor:
+                for i, data in zip(misses, executor.map(self._load_file, [files[i] for i in misses])):
+                    parsed[i] = data
+        else:
+            for i in misses:
+                parsed[i] = self._load_file(files[i])
+        return parsed
 
+    def _lookup_parse_cache(self, filepath: str) -> Tuple[os.stat_result, Optional[Dict[str, Any]]]:
+        """返回文件状态和命中的解析结果，未命中时解析结果为 None"""
+        st = os.stat(filepath)
+        # reload 会在多个线程中调用，缓存的读写需要加锁
+        with self._parse_cache_lock:
+            cached = self._parse_cache.get(filepath)
+            # 使用纳秒时间戳，避免浮点精度导致快速连续写入时命中旧缓存
+            if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                self._parse_cache.move_to_end(filepath)
+                self._logger.debug(f"配置文件未变更，使用缓存: {filepath}")
+                return st, cached[2]
+        return st, None
+
+    def _load_file(self, filepath: str) -> Dict[str, Any]:
+        """根据文件扩展名加载配置文件，返回的字典与解析缓存共享，调用方不能修改"""
+        st, data = self._lookup_parse_cache(filepath)
+        if data is not None:
+            return data
+
+        data = self._parse_file(filepath)
+        with self._parse_cache_lock:
+            self._parse_cache[filepath] = (st.st_mtime_ns, st.st_size, data)
+            self._parse_cache.move_to_end(filepath)
+            if len(self._parse_cache) > _PARSE_CACHE_SIZE:
+                self._parse_cache.popitem(last=False)
+        return data
+
+    def _parse_file(self, filepath: str) -> Dict[str, Any]:
+        """解析配置文件，不经过内存缓存
+
+        设置了 cache_dir 时，YAML/INI 的解析结果会以 JSON 形式缓存到磁盘，
+        缓存文件比源文件新时直接读取缓存。
+        """
         ext = os.path.splitext(filepath)[1].lower()
+        if self._cache_dir is None or ext not in (".ini", ".cfg", ".yaml", ".yml"):
+            return self._parse_source(filepath, ext)
+
+        cache_path = self._sidecar_path(filepath)
+        try:
+            if os.path.getmtime(cache_path) >= os.path.getmtime(filepath):
+                with open(cache_path, 'rb') as f:
+                    return _json_loads(f.read())
+        except (OSError, ValueError):
+            pass
+
+        data = self._parse_source(filepath, ext)
+        self._write_sidecar(cache_path, data)
+        return data
+
+    def _sidecar_path(self, filepath: str) -> str:
+        """计算源文件对应的 JSON 缓存文件路径"""
+        abspath = os.path.abspath(filepath)
+        digest = hashlib.sha1(abspath.encode('utf-8')).hexdigest()[:16]
+        return os.path.join(self._cache_dir, f"{os.path.basename(abspath)}.{digest}.cache.json")
+
+    def _write_sidecar(self, cache_path: str, data: Dict[str, Any]) -> None:
+        """原子地写入 JSON 缓存文件，写入失败不影响加载"""
+        # 非字符串键、日期等无法无损转换为 JSON 的数据不缓存
+        try:
+            dumped = _json_dumps(data)
+            lossless = _json_loads(dumped) == data
+        except (TypeError, ValueError):
+            lossless = False
+        if not lossless:
+            self._logger.debug(f"配置数据无法无损转换为 JSON，跳过缓存: {cache_path}")
+            return
+
+        try:
+            os.makedirs(self._cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self._cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(dumped)
+                os.replace(tmp_path, cache_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            self._logger.warning(f"写入配置缓存失败: {cache_path}: {e}")
+
+    def _parse_source(self, filepath: str, ext: str) -> Dict[str, Any]:
+        """根据文件扩展名解析源文件"""
         if ext in (".ini", ".cfg"):
-            parser = ConfigParser()
-            parser.read(filepath, encoding="utf-8")
-            return self._configparser_to_dict(parser)
+            # 只读取并解码一次，快速解析失败时 ConfigParser 直接复用解码后的文本
+            # 与以文本模式打开文件一致，只按 \n、\r\n 和 \r 分行；str.splitlines 还会在 \x0c、\u2028 等字符处分行
+            lines = io.StringIO(_read_bytes(filepath).decode('utf-8'), newline=None).readlines()
+            data = self._parse_ini(lines)
+            if data is None:
+                # 复用同一个 ConfigParser，reload 会在多个线程中解析文件，需要加锁
+                with self._ini_lock:
+                    if self._ini_parser is None:
+                        self._ini_parser = ConfigParser()
+                    else:
+                        # clear() 不会清除 DEFAULT 段
+                        self._ini_parser.clear()
+                        self._ini_parser.defaults().clear()
+                    self._ini_parser.read_file(lines, source=filepath)
+                    data = self._configparser_to_dict(self._ini_parser)
+            return data
         elif ext == ".json":
-            with open(filepath, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return _json_loads(_read_bytes(filepath))
         elif ext in (".yaml", ".yml"):
             if yaml is None:
                 raise ImportError("PyYAML is not installed. Please install it to parse YAML.")
-            with open(filepath, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f) or {}
+            if not _LIBYAML_AVAILABLE:
+                self._warn_pure_python_yaml()
+            # 以二进制方式把文件对象交给解析器，由 libyaml 按块读取并在 C 层完成解码
+            with open(filepath, 'rb') as f:
+                return yaml.load(f, Loader=_YamlLoader) or {}
         else:
             raise ValueError(f"Unsupported file format: {ext}")
 
+    def _warn_pure_python_yaml(self) -> None:
+        """首次解析 YAML 时提示未使用 libyaml，之后不再重复"""
+        global _libyaml_warned
+        if not _libyaml_warned:
+            _libyaml_warned = True
+            self._logger.warning("PyYAML 未启用 libyaml，YAML 解析较慢；"
+                                 "安装 libyaml 开发包后重新安装 PyYAML 可以提升加载速度")
+
+    def _parse_ini(self, lines: List[str]) -> Optional[Dict[str, Any]]:
+        """快速解析只包含 section 和 key=value 的简单 INI 文件
+
+        遇到插值、DEFAULT 段、多行值、重复键等 ConfigParser 的扩展语法时返回 None，
+        由调用方回退到 ConfigParser，以保证结果与 ConfigParser 一致。
+        """
+        data: Dict[str, Dict[str, str]] = {}
+        section = None
+        for line in lines:
+            stripped = line.strip()
+            if not stripped or stripped[0] in '#;':
+                continue
+            if line[0] in ' \t':
+                return None
+            if stripped[0] == '[':
+                mo = _INI_SECTION_RE.match(stripped)
+                if mo is None:
+                    return None
+                name = mo.group(1)
+                if name == 'DEFAULT' or name in data:
+                    return None
+                section = data[name] = {}
+                continue
+            if section is None or '%' in stripped:
+                return None
+            eq = stripped.find('=')
+            colon = stripped.find(':')
+            if colon != -1 and (eq == -1 or colon < eq):
+                eq = colon
+            if eq <= 0:
+                return None
+            key = stripped[:eq].rstrip().lower()
+            if not key or key in section:
+                return None
+            section[key] = stripped[eq + 1:].lstrip()
+        return data
+
     def _configparser_to_dict(self, parser: ConfigParser) -> Dict[str, Any]:
         """将 ConfigParser 转换为字典"""
-        data = {}
-        for section in parser.sections():
-            data[section] = {}
-            for key, val in parser.items(section):
-                data[section][key] = val
-        return data
+        # 没有 DEFAULT 段且不含插值语法时，items() 的结果就是原始值，直接复制内部的段字典
+        sections = getattr(parser, "_sections", None)
+        if sections is not None and not parser.defaults():
+            data = {section: dict(values) for section, values in sections.items()}
+            if not any(value and '%' in value for values in data.values() for value in values.values()):
+                return data
+        return {section: dict(parser.items(section)) for section in parser.sections()}
 
     def _merge_dict(self, base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
-        """递归合并字典"""
-        for k, v in override.items():
-            if (
-                k in base
-                and isinstance(base[k], dict)
-                and isinstance(v, dict)
-            ):
-                base[k] = self._merge_dict(base[k], v)
-            else:
-                base[k] = v
+        """将 override 深度合并到 base 中（原地修改 base）
+
+        使用显式栈代替递归，避免深层嵌套时的函数调用开销和递归深度限制。
+        """
+        stack = [(base, override)]
+        while stack:
+            b, o = stack.pop()
+            if not b:
+                # 目标为空时无需逐键比较
+                b.update(o)
+                continue
+            for k, v in o.items():
+                bv = b.get(k)
+                if isinstance(bv, dict) and isinstance(v, dict):
+                    stack.append((bv, v))
+                else:
+                    b[k] = v
         return base
 
     def _set(self, key: str, value: Any) -> None:
         """设置配置值"""
-        keys = key.split('.')
-        cur = self._config_data
-        for i, k in enumerate(keys):
-            if i == len(keys) - 1:
-                cur[k] = value
-            else:
-                if k not in cur:
-                    cur[k] = {}
-                cur = cur[k]
+        self._materialize()
+        self._merged_for = None
+        head, sep, tail = key.partition('.')
+        if not sep:
+            self._config_data[key] = value
+        elif '.' not in tail:
+            # 两级键最常见，直接处理，不切分整个键
+            self._config_data.setdefault(head, {})[tail] = value
+        else:
+            keys = _split(key)
+            cur = self._config_data
+            for k in keys[:-1]:
+                cur = cur.setdefault(k, {})
+            cur[keys[-1]] = value
 
-    def _cast_value(self, val: Any, cast_type: Union[type, Callable]) -> Any:
-        """执行类型转换"""
+    def _cast_value(self, val: Any, cast_type: Union[type, str, Callable]) -> Any:
+        """执行类型转换，cast_type 为字符串时按名称查找已注册的转换器"""
+        if type(cast_type) is str:
+            # 未知的转换器名称会在调用时抛出 TypeError
+            cast_type = self._type_converters.get(cast_type, cast_type)
         if cast_type is bool:
             return self._convert_bool(val)
         return cast_type(val)
 
     def _convert_bool(self, val: Any) -> bool:
         """转换布尔值"""
-        if isinstance(val, bool):
-            return val
         if isinstance(val, str):
-            lower_val = val.lower()
-            if lower_val in ["true", "yes", "1"]:
-                return True
-            elif lower_val in ["false", "no", "0"]:
-                return False
+            return _BOOL_MAP.get(val.lower(), val != "")
         return bool(val)
 
     def _convert_list(self, val: Union[str, list]) -> list:
@@ -619,7 +1564,9 @@ class Config:
         if isinstance(val, list):
             return val
         if isinstance(val, str):
-            return [item.strip() for item in val.split(',')]
+            if ',' not in val:
+                return [val.strip()]
+            return _LIST_SPLIT.split(val.strip())
         return list(val)
 
     def _convert_dict(self, val: Union[str, dict]) -> dict:
@@ -632,3 +1579,7 @@ class Config:
             except json.JSONDecodeError:
                 return {k.strip(): v.strip() for k, v in (item.split('=') for item in val.split(','))}
         return dict(val)
+
+    def _convert_path(self, val: Union[str, os.PathLike]) -> str:
+        """转换路径，展开开头的 ~"""
+        return os.path.expanduser(os.fspath(val))
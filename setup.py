@@ -31,6 +31,10 @@ setup(
     install_requires=[
         'PyYAML==6.0.1',
     ],
+    extras_require={
+        'watch': ['watchdog'],
+        'lazy': ['ijson>=3.1'],
+    },
     project_urls={
         "Bug Reports": "https://github.com/wang-zhibo/ccconfig/issues",
         "Source": "https://github.com/wang-zhibo/ccconfig",